@@ -5,7 +5,7 @@ from sampler import sample_frames
 from collator import build_timeline
 from s3_utils import is_s3_uri
 from vision import analyze_video_s3
-import boto3
+from clients import rekognition_client
 
 app = FastAPI()
 
@@ -24,7 +24,7 @@ async def summarize_video(path: str):
         # For local videos, use frame sampling approach
         else:
             frames = sample_frames(path)
-            rek = boto3.client("rekognition")
+            rek = rekognition_client()
             events = []
             for ts, frame_path in frames:
                 with open(frame_path, "rb") as img:
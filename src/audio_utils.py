@@ -2,7 +2,7 @@
 import os
 import tempfile
 from typing import List, Tuple
-import ffmpeg
+from sampler import ensure_ffmpeg
 
 def concat_audio_segments(audio_segments: List[Tuple[float, str]], output_path: str = None) -> str:
     """
@@ -12,6 +12,8 @@ def concat_audio_segments(audio_segments: List[Tuple[float, str]], output_path:
     """
     if not audio_segments:
         raise ValueError("No audio segments provided")
+    import ffmpeg
+    ensure_ffmpeg()
     # Sort by timestamp
     audio_segments = sorted(audio_segments, key=lambda x: x[0])
     # Calculate silence durations between segments
@@ -69,6 +71,8 @@ def mux_audio_to_video(video_path: str, audio_path: str, output_path: str = None
     if output_path is None:
         fd, output_path = tempfile.mkstemp(suffix="_muxed.mp4")
         os.close(fd)
+    import ffmpeg
+    ensure_ffmpeg()
     
     # Create the stream objects
     video_stream = ffmpeg.input(video_path)
@@ -0,0 +1,159 @@
+# Cold-start benchmark for the CLI, based on `python -X importtime`
+#
+#   python src/bench_startup.py [--repeat 5] [--json startup.json]
+#
+# For each CLI mode a fresh interpreter is started with -X importtime. Modes
+# that run offline (--help, --input-timeline) execute the real CLI; modes that
+# need AWS/OpenAI import what that mode loads and construct its SDK clients,
+# so they measure startup cost without making any network calls. Reports
+# median wall time, total import time, client construction time and the most
+# expensive top-level imports per mode. A mode whose optional SDK is not
+# installed is reported as skipped rather than measured without it; any other
+# error marks the mode as failed and makes the benchmark exit non-zero.
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(SRC_DIR, "main.py")
+
+# (modules imported on top of main.py, clients.py getters) per network-bound mode
+STAGE_IMPORTS = {
+    "video-local": (["collator", "sampler", "ffmpeg", "boto3"], ["rekognition_client"]),
+    "video-s3": (["collator", "vision", "boto3"], ["rekognition_client"]),
+    "summary": (["collator", "summarizer", "openai"], ["openai_client"]),
+    "voiceover-audio": (["collator", "summarizer", "tts", "audio_utils", "openai", "ffmpeg"], ["openai_client"]),
+}
+
+# Placeholders so clients can be constructed offline; real values win if set
+OFFLINE_ENV = {"AWS_DEFAULT_REGION": "us-east-1", "OPENAI_API_KEY": "bench-placeholder"}
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+CLIENT_MS_RE = re.compile(r"^client_ms=([\d.]+)$", re.MULTILINE)
+# Missing optional SDKs skip a mode; every other error fails it
+MISSING_SDK_RE = re.compile(r"^ModuleNotFoundError: No module named '(boto3|botocore|openai|ffmpeg)[.']", re.MULTILINE)
+
+
+class ModeSkipped(Exception):
+    """A mode cannot run here because an optional SDK is not installed."""
+
+
+class ModeFailed(Exception):
+    """A mode crashed; the CLI or a stage is broken."""
+
+
+def cli_modes(workdir: str) -> dict:
+    """Map mode name -> interpreter arguments (after -X importtime)."""
+    timeline_in = os.path.join(workdir, "timeline.json")
+    with open(timeline_in, "w", encoding="utf-8") as f:
+        json.dump([{"t": 0.0, "labels": [{"Name": "Person", "Confidence": 99.0}]}], f)
+    modes = {
+        "help": [MAIN, "--help"],
+        "timeline-json": [MAIN, "--input-timeline", timeline_in,
+                          "--timeline-json", os.path.join(workdir, "out.json")],
+    }
+    for name, (modules, getters) in STAGE_IMPORTS.items():
+        code = f"import sys, time; sys.path.insert(0, {SRC_DIR!r}); import main, clients"
+        code += "".join(f"\nimport {m}" for m in modules)
+        code += "\n_start = time.perf_counter()"
+        code += "".join(f"\nclients.{g}()" for g in getters)
+        code += "\nprint(f'client_ms={(time.perf_counter() - _start) * 1000.0:.1f}')"
+        modes[name] = ["-c", code]
+    return modes
+
+
+def parse_importtime(stderr: str) -> list:
+    """Return [(module, cumulative_us)] for top-level imports in -X importtime output."""
+    top_level = []
+    for line in stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        # Nested imports are indented by two spaces per level after the "|"
+        if m and len(m.group(3)) <= 1:
+            top_level.append((m.group(4), int(m.group(2))))
+    return top_level
+
+
+def run_mode(args: list) -> tuple[float, list, float | None]:
+    """Run one cold interpreter; returns (wall_ms, top-level imports, client_ms or None)."""
+    env = {**OFFLINE_ENV, **os.environ}
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args],
+                          cwd=SRC_DIR, capture_output=True, text=True, env=env)
+    wall_ms = (time.perf_counter() - start) * 1000.0
+    if proc.returncode != 0:
+        errors = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        reason = errors[-1] if errors else f"exited with {proc.returncode}"
+        if MISSING_SDK_RE.search(proc.stderr):
+            raise ModeSkipped(reason)
+        raise ModeFailed(reason)
+    m = CLIENT_MS_RE.search(proc.stdout)
+    return wall_ms, parse_importtime(proc.stderr), float(m.group(1)) if m else None
+
+
+def benchmark(repeat: int = 5, top: int = 5) -> dict:
+    """
+    Benchmark every CLI mode and return {mode: stats}. A mode that cannot run
+    maps to {"skipped": reason} (SDK not installed) or {"failed": reason}.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as workdir:
+        for name, args in cli_modes(workdir).items():
+            walls, imports, client_times = [], [], []
+            try:
+                for _ in range(repeat):
+                    wall_ms, top_level, client_ms = run_mode(args)
+                    walls.append(wall_ms)
+                    imports.append(top_level)
+                    client_times.append(client_ms)
+            except ModeSkipped as e:
+                results[name] = {"skipped": str(e)}
+                continue
+            except ModeFailed as e:
+                results[name] = {"failed": str(e)}
+                continue
+            # Import breakdown from the median run
+            median_run = sorted(range(repeat), key=lambda i: walls[i])[repeat // 2]
+            top_level = imports[median_run]
+            results[name] = {
+                "wall_ms": round(statistics.median(walls), 1),
+                "import_ms": round(sum(us for _, us in top_level) / 1000.0, 1),
+                "client_ms": round(statistics.median(client_times), 1) if None not in client_times else None,
+                "top_imports": [{"module": mod, "ms": round(us / 1000.0, 1)}
+                                for mod, us in sorted(top_level, key=lambda x: -x[1])[:top]],
+            }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure CLI cold-start latency per mode")
+    parser.add_argument("--repeat", type=int, default=5, help="Cold runs per mode (median is reported)")
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest top-level imports to list")
+    parser.add_argument("--json", type=str, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    results = benchmark(repeat=args.repeat, top=args.top)
+    print(f"{'mode':<18}{'wall ms':>10}{'import ms':>12}{'client ms':>12}  slowest imports")
+    for name, r in results.items():
+        if "skipped" in r or "failed" in r:
+            status = "skipped" if "skipped" in r else "FAILED"
+            print(f"{name:<18}  {status}: {r.get('skipped') or r['failed']}")
+            continue
+        client_ms = "-" if r["client_ms"] is None else r["client_ms"]
+        slowest = ", ".join(f"{i['module']} {i['ms']}" for i in r["top_imports"])
+        print(f"{name:<18}{r['wall_ms']:>10}{r['import_ms']:>12}{client_ms:>12}  {slowest}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+    if any("failed" in r for r in results.values()):
+        sys.exit(1)
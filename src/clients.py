@@ -0,0 +1,60 @@
+# Shared, lazily-created SDK clients (boto3 / OpenAI)
+#
+# The AWS and OpenAI SDKs are slow to import, so they are only pulled in the
+# first time a client is requested. Clients are cached per process and per
+# credential-related environment: a one-shot CLI run pays for them once, and
+# the warm worker (see worker.py) reuses them across invocations while still
+# picking up a caller's different AWS_*/OPENAI_* settings.
+import os
+from functools import lru_cache
+
+OPENAI_ENV_VARS = ("OPENAI_API_KEY", "OPENAI_BASE_URL", "OPENAI_ORG_ID", "OPENAI_PROJECT_ID")
+
+
+def credential_env(environ=None) -> dict:
+    """The environment variables that decide which AWS/OpenAI account a client uses."""
+    environ = os.environ if environ is None else environ
+    return {k: v for k, v in environ.items() if k.startswith("AWS_") or k in OPENAI_ENV_VARS}
+
+
+def _aws_env_key() -> tuple:
+    return tuple(sorted((k, v) for k, v in credential_env().items() if k.startswith("AWS_")))
+
+
+@lru_cache(maxsize=None)
+def _aws_client(service: str, env_key: tuple):
+    import boto3
+    # A fresh session reads profile, region and credentials from the current environment
+    return boto3.session.Session().client(service)
+
+
+def aws_client(service: str):
+    """Return a cached boto3 client for the given AWS service name."""
+    return _aws_client(service, _aws_env_key())
+
+
+def rekognition_client():
+    """Return the shared Rekognition client."""
+    return aws_client("rekognition")
+
+
+def s3_client():
+    """Return the shared S3 client."""
+    return aws_client("s3")
+
+
+def _openai_env_key() -> tuple:
+    return tuple(sorted((k, v) for k, v in credential_env().items() if k in OPENAI_ENV_VARS))
+
+
+@lru_cache(maxsize=None)
+def _openai_client(env_key: tuple):
+    import openai
+    env = dict(env_key)
+    return openai.OpenAI(api_key=env.get("OPENAI_API_KEY"), base_url=env.get("OPENAI_BASE_URL"),
+                         organization=env.get("OPENAI_ORG_ID"), project=env.get("OPENAI_PROJECT_ID"))
+
+
+def openai_client():
+    """Return a cached OpenAI client configured from the OPENAI_* environment."""
+    return _openai_client(_openai_env_key())
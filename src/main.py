@@ -1,13 +1,12 @@
-import argparse, json, tempfile, subprocess, boto3, openai, os
-from sampler import sample_frames
-from collator import build_timeline
-from summarizer import summarize
+import argparse, json, os, sys
 from s3_utils import is_s3_uri, download_from_s3
-from vision import analyze_video_s3
 
-def main():
+# Pipeline stages (ffmpeg, boto3, openai) are imported inside run() only when
+# the selected mode needs them, so --help and --input-timeline start fast.
 
-    parser = argparse.ArgumentParser()
+def build_parser() -> argparse.ArgumentParser:
+    # allow_abbrev=False: --worker must be spelled out so it can be stripped before forwarding
+    parser = argparse.ArgumentParser(prog=os.path.basename(__file__), allow_abbrev=False)
     parser.add_argument("--video", type=str, help="Input video file to process. Can be a local path or S3 URL (s3://bucket/key)")
     parser.add_argument("--input-timeline", type=str, help="Use a pregenerated timeline JSON instead of processing a video")
     parser.add_argument("--fps", type=int, default=1)
@@ -22,21 +21,43 @@ def main():
     parser.add_argument("--voiceover-audio", action="store_true", help="Generate TTS audio for the voiceover script, aligned to video events.")
     parser.add_argument("--voiceover-concat", action="store_true", help="Concatenate TTS audio segments into a single audio file.")
     parser.add_argument("--voiceover-mux", action="store_true", help="Mux the concatenated TTS audio back into the video.")
-    args = parser.parse_args()
+    parser.add_argument("--worker", action="store_true", help="Run through a warm worker (src/worker.py) if one is running; falls back to running in-process. Your working directory and AWS_*/OPENAI_* environment are forwarded; output is shown when the run finishes.")
+    return parser
 
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
+    if args.worker:
+        from worker import run_in_worker
+        forwarded = [a for a in (sys.argv[1:] if argv is None else argv) if a != "--worker"]
+        code = run_in_worker(forwarded)
+        if code is not None:
+            if code:
+                sys.exit(code)
+            return
+        print("No warm worker running; continuing in-process.", file=sys.stderr)
+
+    run(args, parser)
+
+def run(args: argparse.Namespace, parser: argparse.ArgumentParser):
+    """Run the pipeline for already-parsed CLI arguments (never forwards to a worker)."""
+    from collator import build_timeline
     if args.input_timeline:
         with open(args.input_timeline, "r", encoding="utf-8") as f:
             timeline = json.load(f)
     elif args.video:
         # For S3 videos, use Rekognition Video APIs directly
         if is_s3_uri(args.video):
+            from vision import analyze_video_s3
             events = analyze_video_s3(args.video)
             timeline = build_timeline(events)
         # For local videos, use frame sampling approach
         else:
+            from sampler import sample_frames
+            from clients import rekognition_client
             frames = sample_frames(args.video, fps=args.fps)        # ffmpeg
-            rek = boto3.client("rekognition")
+            rek = rekognition_client()
             events = []
             for ts, frame_path in frames:
                 event = {"t": ts}
@@ -65,9 +86,7 @@ def main():
         print(f"Timeline written to {args.timeline_json}")
         return
 
-    from summarizer import summarize_chunked, generate_voiceover_script, generate_voiceover_script_chunked
-    from tts import generate_timed_voiceover, tts_openai
-    from audio_utils import concat_audio_segments, mux_audio_to_video
+    from summarizer import summarize, summarize_chunked, generate_voiceover_script, generate_voiceover_script_chunked
     if args.voiceover:
         if args.chunked:
             script = generate_voiceover_script_chunked(timeline, style=args.style)
@@ -75,6 +94,8 @@ def main():
             script = generate_voiceover_script(timeline, style=args.style)
         print(f"Voiceover script (style: {args.style}):\n", script)
         if args.voiceover_audio:
+            from tts import generate_timed_voiceover, tts_openai
+            from audio_utils import concat_audio_segments, mux_audio_to_video
             print("Generating timed voiceover audio...")
             audio_segments = generate_timed_voiceover(timeline, script, tts_func=tts_openai)
             for ts, audio_path in audio_segments:
@@ -2,9 +2,9 @@
 
 import os
 import tempfile
-import boto3
 from urllib.parse import urlparse
 from typing import Optional, List
+from clients import s3_client
 
 def is_s3_uri(uri: str) -> bool:
     """Returns True if uri is an S3 URI (s3://bucket/key)."""
@@ -38,7 +38,7 @@ def download_from_s3(uri: str, target_path: str = None) -> str:
         target_path = temp.name
         temp.close()
 
-    s3 = boto3.client('s3')
+    s3 = s3_client()
     s3.download_file(bucket, key, target_path)
     return target_path
 def upload_to_s3(local_file_path: str, bucket: str, key: str = None) -> str:
@@ -50,7 +50,7 @@ def upload_to_s3(local_file_path: str, bucket: str, key: str = None) -> str:
     if key is None:
         key = os.path.basename(local_file_path)
     
-    s3 = boto3.client('s3')
+    s3 = s3_client()
     s3.upload_file(local_file_path, bucket, key)
     return f"s3://{bucket}/{key}"
 
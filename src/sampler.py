@@ -1,17 +1,27 @@
 # ffmpeg helpers for frame sampling
-
-# Ensure the bundled ffmpeg binary is used (Windows, project-local)
 import os
-import sys
+import shutil
 import tempfile
+from functools import lru_cache
 from typing import List, Tuple
-import ffmpeg
 from s3_utils import is_s3_uri, download_from_s3
 
-# Prepend the bundled ffmpeg bin directory to PATH if not already present
+# Bundled ffmpeg build (Windows, project-local)
 FFMPEG_BIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tools', 'ffmpeg-7.1.1-essentials_build', 'bin'))
-if FFMPEG_BIN_DIR not in os.environ["PATH"]:
-    os.environ["PATH"] = FFMPEG_BIN_DIR + os.pathsep + os.environ["PATH"]
+
+@lru_cache(maxsize=None)
+def ensure_ffmpeg() -> str:
+    """
+    Resolve the ffmpeg binary once per process and return its path.
+    Prefers the bundled build by prepending its bin directory to PATH, so
+    ffmpeg-python picks it up; otherwise falls back to whatever is on PATH.
+    """
+    if os.path.isdir(FFMPEG_BIN_DIR) and FFMPEG_BIN_DIR not in os.environ.get("PATH", "").split(os.pathsep):
+        os.environ["PATH"] = FFMPEG_BIN_DIR + os.pathsep + os.environ.get("PATH", "")
+    path = shutil.which("ffmpeg")
+    if path is None:
+        raise FileNotFoundError("ffmpeg binary not found (bundled build missing and not in PATH)")
+    return path
 
 def sample_frames(video_path: str, fps: int = 1) -> List[Tuple[float, str]]:
     """Extract frames from video at given fps. Returns list of (timestamp, frame_path)."""
@@ -24,6 +34,8 @@ def sample_frames(video_path: str, fps: int = 1) -> List[Tuple[float, str]]:
         local_video = download_from_s3(video_path)
     
     try:
+        import ffmpeg
+        ensure_ffmpeg()
         # Extract frames using ffmpeg
         (
             ffmpeg
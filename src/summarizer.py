@@ -1,7 +1,6 @@
 # OpenAI LLM summarizer
-import openai
-import os
 import json
+from clients import openai_client
 
 
 def summarize(timeline: list) -> str:
@@ -10,7 +9,7 @@ def summarize(timeline: list) -> str:
         "Given this JSON timeline, write ≤4 sentences describing the main events and setting.\n"
         f"Timeline: {json.dumps(timeline)}"
     )
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    client = openai_client()
     response = client.chat.completions.create(
         model="gpt-4.1-nano",
         messages=[{"role": "user", "content": prompt}],
@@ -27,7 +26,7 @@ def generate_voiceover_script(timeline: list, style: str = "Sports Commentator")
         f"Given this JSON timeline, create a short voiceover script in the style of {style}. Include only the narration.\n"
         f"Timeline: {json.dumps(timeline)}"
     )
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    client = openai_client()
     response = client.chat.completions.create(
         model="gpt-4.1-nano",
         messages=[{"role": "user", "content": prompt}],
@@ -42,7 +41,7 @@ def summarize_chunked(timeline: list, chunk_size: int = 20) -> str:
     Summarize the timeline in chunks, then summarize the summaries.
     Each chunk is summarized separately, then a final summary is generated from those summaries.
     """
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    client = openai_client()
     chunk_summaries = []
     for i in range(0, len(timeline), chunk_size):
         chunk = timeline[i:i+chunk_size]
@@ -75,7 +74,7 @@ def generate_voiceover_script_chunked(timeline: list, style: str = "David Attenb
     """
     Generate a voiceover script in the given style using chunked summarization for long timelines.
     """
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    client = openai_client()
     chunk_scripts = []
     for i in range(0, len(timeline), chunk_size):
         chunk = timeline[i:i+chunk_size]
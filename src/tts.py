@@ -3,25 +3,17 @@
 import os
 import tempfile
 from typing import List, Dict, Tuple
-
-try:
-    import openai
-except ImportError:
-    openai = None
-
-try:
-    import pyttsx3
-except ImportError:
-    pyttsx3 = None
+from clients import openai_client
 
 def tts_openai(text: str, voice: str = "alloy", output_path: str = None) -> str:
     """
     Generate speech audio from text using OpenAI TTS API.
     Returns the path to the generated audio file.
     """
-    if openai is None:
+    try:
+        client = openai_client()
+    except ImportError:
         raise ImportError("openai package is required for OpenAI TTS")
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     if output_path is None:
         fd, output_path = tempfile.mkstemp(suffix=".mp3")
         os.close(fd)
@@ -41,7 +33,9 @@ def tts_local(text: str, output_path: str = None) -> str:
     Generate speech audio from text using pyttsx3 (offline, local TTS).
     Returns the path to the generated audio file.
     """
-    if pyttsx3 is None:
+    try:
+        import pyttsx3
+    except ImportError:
         raise ImportError("pyttsx3 package is required for local TTS")
     engine = pyttsx3.init()
     if output_path is None:
@@ -8,8 +8,8 @@ import argparse
 from typing import List
 
 # Add the src directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.s3_utils import upload_to_s3, upload_files_to_s3
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from s3_utils import upload_to_s3, upload_files_to_s3
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Upload videos to S3 for Rekognition testing")
@@ -1,12 +1,12 @@
 # AWS Rekognition wrapper
 import time
-import boto3
 from typing import List, Dict
 from s3_utils import is_s3_uri, parse_s3_uri
+from clients import rekognition_client
 
 def detect_labels_on_frames(frames: List[str], max_labels=10, min_conf=60) -> List[Dict]:
     """Detect labels on a list of local image frame files."""
-    rek = boto3.client("rekognition")
+    rek = rekognition_client()
     results = []
     for frame_path in frames:
         with open(frame_path, "rb") as img:
@@ -30,7 +30,7 @@ def analyze_video_s3(video_uri: str, min_confidence: float = 60.0) -> List[Dict]
     Returns a list of label detection events with timestamps.
     """
     bucket, key = parse_s3_uri(video_uri)
-    rek = boto3.client('rekognition')
+    rek = rekognition_client()
     
     # Start async video analysis
     response = rek.start_label_detection(
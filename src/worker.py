@@ -0,0 +1,242 @@
+# Warm worker: a long-lived process that keeps the SDKs imported and the
+# boto3/OpenAI clients initialized, so repeated CLI runs skip cold start.
+#
+#   python src/worker.py                 # start the worker (foreground)
+#   python src/main.py --worker ...      # run a CLI invocation through it
+#   python src/worker.py --stop          # shut it down
+#
+# Requests are handled one at a time; the caller's working directory and
+# AWS_*/OPENAI_* environment are applied for the run, and the CLI's output is
+# sent back to the caller when the run finishes.
+#
+# Connections are authenticated with a random key that the worker writes to a
+# per-user, per-port file (mode 0600) on startup; only processes that can read
+# that file can talk to the worker.
+import argparse
+import contextlib
+import io
+import os
+import secrets
+import socket
+import sys
+import traceback
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Connection, Listener, answer_challenge, deliver_challenge, wait
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_KEYDIR = os.path.join(os.path.expanduser("~"), ".video_commentator")
+# How long a client waits for the auth handshake before deciding nothing usable is listening
+HANDSHAKE_TIMEOUT = 5.0
+
+
+def worker_address() -> tuple[str, int]:
+    """(host, port) of the worker, overridable via VIDEO_COMMENTATOR_WORKER=host:port."""
+    value = os.getenv("VIDEO_COMMENTATOR_WORKER")
+    if not value:
+        return DEFAULT_HOST, DEFAULT_PORT
+    host, _, port = value.rpartition(":")
+    return host or DEFAULT_HOST, int(port)
+
+
+def keyfile_path(port: int) -> str:
+    """Auth key file of the worker on the given port (directory: VIDEO_COMMENTATOR_WORKER_KEYDIR)."""
+    keydir = os.getenv("VIDEO_COMMENTATOR_WORKER_KEYDIR") or DEFAULT_KEYDIR
+    return os.path.join(keydir, f"worker-{port}.key")
+
+
+def write_authkey(key: bytes, path: str):
+    """Store the worker's auth key readable by the current user only."""
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    # O_CREAT's mode does not apply to an existing file
+    os.chmod(path, 0o600)
+
+
+def read_authkey(path: str):
+    """Return the worker's auth key, or None if no worker has created one."""
+    try:
+        with open(path, "rb") as f:
+            return f.read() or None
+    except FileNotFoundError:
+        return None
+
+
+def warm_up():
+    """Import the heavy SDKs and create the shared clients up front."""
+    from sampler import ensure_ffmpeg
+    from clients import rekognition_client, s3_client, openai_client
+    for name, init in (("ffmpeg", ensure_ffmpeg), ("rekognition", rekognition_client),
+                       ("s3", s3_client), ("openai", openai_client)):
+        try:
+            init()
+        except Exception as e:
+            # Not fatal: the stage will retry (and report) when it is actually used
+            print(f"Warm-up of {name} failed: {e}", file=sys.stderr)
+
+
+@contextlib.contextmanager
+def _caller_env(env: dict):
+    """Temporarily replace the worker's AWS_*/OPENAI_* variables with the caller's."""
+    from clients import credential_env
+    saved = credential_env()
+    for k in saved:
+        del os.environ[k]
+    os.environ.update(credential_env(env))
+    try:
+        yield
+    finally:
+        for k in credential_env():
+            del os.environ[k]
+        os.environ.update(saved)
+
+
+def handle_request(argv: list, cwd: str, env: dict = None) -> dict:
+    """Run the CLI for argv from cwd, capturing its output. Returns {"code", "output"}."""
+    from main import build_parser, run
+    out = io.StringIO()
+    code = 0
+    prev_cwd = os.getcwd()
+    try:
+        os.chdir(cwd)
+        with _caller_env(env or {}), contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            try:
+                parser = build_parser()
+                args = parser.parse_args(argv)
+                # Never forward again from inside the worker: it would connect to itself
+                args.worker = False
+                run(args, parser)
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        os.chdir(prev_cwd)
+    return {"code": code, "output": out.getvalue()}
+
+
+def _valid_request(request) -> bool:
+    return (isinstance(request, dict)
+            and isinstance(request.get("argv"), list)
+            and all(isinstance(a, str) for a in request["argv"])
+            and isinstance(request.get("cwd"), str)
+            and isinstance(request.get("env", {}), dict))
+
+
+def serve(address: tuple[str, int]):
+    """Warm up, then serve CLI requests until a stop request arrives."""
+    warm_up()
+    # A fresh random key per run; it is published only once the socket is bound
+    authkey = secrets.token_bytes(32)
+    with Listener(address, authkey=authkey) as listener:
+        # Use the bound port, so port 0 (pick a free one) gets its own key file
+        keyfile = keyfile_path(listener.address[1])
+        write_authkey(authkey, keyfile)
+        print(f"Worker listening on {listener.address[0]}:{listener.address[1]}", flush=True)
+        try:
+            _serve_requests(listener)
+        finally:
+            # Leave the file alone if another worker has since taken it over
+            if read_authkey(keyfile) == authkey:
+                with contextlib.suppress(OSError):
+                    os.remove(keyfile)
+
+
+def _serve_requests(listener: Listener):
+    while True:
+        try:
+            conn = listener.accept()
+        except Exception as e:
+            print(f"Rejected connection: {e}", file=sys.stderr)
+            continue
+        with conn:
+            try:
+                request = conn.recv()
+                if isinstance(request, dict) and request.get("stop"):
+                    conn.send({"code": 0, "output": "Worker stopped.\n"})
+                    return
+                if not _valid_request(request):
+                    conn.send({"code": 2, "output": "Malformed worker request.\n"})
+                    continue
+                conn.send(handle_request(request["argv"], request["cwd"], request.get("env")))
+            except Exception as e:
+                # e.g. the caller hung up (Ctrl-C) before the run finished
+                print(f"Request failed: {e!r}", file=sys.stderr)
+
+
+def _connect(address: tuple[str, int], authkey: bytes):
+    """
+    Open an authenticated connection to the worker, or return None if nothing
+    usable answers within HANDSHAKE_TIMEOUT (no listener, or not a worker).
+    """
+    try:
+        sock = socket.create_connection(address, timeout=HANDSHAKE_TIMEOUT)
+    except OSError:
+        return None
+    sock.setblocking(True)
+    conn = Connection(sock.detach())
+    try:
+        # The worker speaks first; anything that stays silent is not a worker
+        if not wait([conn], HANDSHAKE_TIMEOUT):
+            conn.close()
+            return None
+        answer_challenge(conn, authkey)
+        deliver_challenge(conn, authkey)
+    except AuthenticationError:
+        conn.close()
+        print("Worker rejected the auth key (stale key file?).", file=sys.stderr)
+        return None
+    except (EOFError, OSError):
+        conn.close()
+        return None
+    return conn
+
+
+def _send(request: dict, address: tuple[str, int] = None):
+    """Send a request to the worker. Returns its response, or None if no worker is reachable."""
+    address = address or worker_address()
+    authkey = read_authkey(keyfile_path(address[1]))
+    if authkey is None:
+        return None
+    conn = _connect(address, authkey)
+    if conn is None:
+        return None
+    with conn:
+        try:
+            conn.send(request)
+            return conn.recv()
+        except (EOFError, OSError) as e:
+            # The worker died or hung up mid-run; don't silently re-run in-process
+            return {"code": 1, "output": f"Lost connection to the worker: {e!r}\n"}
+
+
+def run_in_worker(argv: list, address: tuple[str, int] = None):
+    """
+    Run a CLI invocation in the warm worker and print its output.
+    Returns the exit code, or None if no worker is running.
+    """
+    from clients import credential_env
+    response = _send({"argv": argv, "cwd": os.getcwd(), "env": credential_env()}, address)
+    if response is None:
+        return None
+    print(response["output"], end="")
+    return response["code"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm worker for the video commentator CLI")
+    parser.add_argument("--host", type=str, default=None, help="Address to listen on (default: 127.0.0.1 or VIDEO_COMMENTATOR_WORKER)")
+    parser.add_argument("--port", type=int, default=None, help="Port to listen on (default: 8765 or VIDEO_COMMENTATOR_WORKER)")
+    parser.add_argument("--stop", action="store_true", help="Stop a running worker and exit")
+    args = parser.parse_args()
+
+    host, port = worker_address()
+    address = (args.host or host, args.port or port)
+    if args.stop:
+        response = _send({"stop": True}, address)
+        print(response["output"].strip() if response else "No worker running.")
+    else:
+        serve(address)
@@ -0,0 +1,5 @@
+# Make the flat modules under src/ importable, as they are when running src/main.py
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
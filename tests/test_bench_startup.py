@@ -0,0 +1,23 @@
+# Tests for how the startup benchmark classifies failing modes
+import pytest
+
+import bench_startup
+
+
+def test_missing_optional_sdk_skips_mode():
+    with pytest.raises(bench_startup.ModeSkipped, match="openai"):
+        bench_startup.run_mode(["-c", "raise ModuleNotFoundError(\"No module named 'openai'\")"])
+
+
+@pytest.mark.parametrize("code", [
+    "raise RuntimeError('cli is broken')",
+    "raise ModuleNotFoundError(\"No module named 'collator'\")",
+])
+def test_other_errors_fail_mode(code):
+    with pytest.raises(bench_startup.ModeFailed):
+        bench_startup.run_mode(["-c", code])
+
+
+def test_client_time_is_parsed():
+    wall_ms, _, client_ms = bench_startup.run_mode(["-c", "print('client_ms=12.5')"])
+    assert client_ms == 12.5 and wall_ms > 0
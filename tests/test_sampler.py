@@ -0,0 +1,39 @@
+# Tests for cached ffmpeg discovery
+import os
+import shutil
+
+import pytest
+
+import sampler
+
+
+@pytest.fixture(autouse=True)
+def clear_ffmpeg_cache():
+    sampler.ensure_ffmpeg.cache_clear()
+    yield
+    sampler.ensure_ffmpeg.cache_clear()
+
+
+def test_ensure_ffmpeg_is_resolved_once(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(sampler, "FFMPEG_BIN_DIR", str(tmp_path / "bin"))
+    monkeypatch.setattr(shutil, "which", lambda name: calls.append(name) or "/opt/ffmpeg")
+    assert sampler.ensure_ffmpeg() == "/opt/ffmpeg"
+    assert sampler.ensure_ffmpeg() == "/opt/ffmpeg"
+    assert calls == ["ffmpeg"]
+
+
+def test_ensure_ffmpeg_prefers_bundled_build(monkeypatch, tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setattr(sampler, "FFMPEG_BIN_DIR", str(bin_dir))
+    monkeypatch.setenv("PATH", "/usr/bin")
+    monkeypatch.setattr(shutil, "which", lambda name: os.path.join(os.environ["PATH"].split(os.pathsep)[0], name))
+    assert sampler.ensure_ffmpeg() == os.path.join(str(bin_dir), "ffmpeg")
+
+
+def test_ensure_ffmpeg_errors_when_missing(monkeypatch, tmp_path):
+    monkeypatch.setattr(sampler, "FFMPEG_BIN_DIR", str(tmp_path / "missing"))
+    monkeypatch.setenv("PATH", str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        sampler.ensure_ffmpeg()
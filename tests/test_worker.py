@@ -0,0 +1,205 @@
+# Tests for the warm worker and the CLI's --worker forwarding
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+import types
+from multiprocessing.connection import Client, Listener
+
+import pytest
+
+import clients
+import main
+import worker
+
+
+@pytest.fixture
+def timeline_file(tmp_path):
+    path = tmp_path / "timeline.json"
+    path.write_text(json.dumps([{"t": 1.0, "labels": [{"Name": "Ball"}]}]), encoding="utf-8")
+    return path
+
+
+def test_worker_flag_is_stripped_before_forwarding(monkeypatch, timeline_file):
+    forwarded = []
+    monkeypatch.setattr(worker, "run_in_worker", lambda argv: forwarded.append(argv) or 0)
+    main.main(["--worker", "--input-timeline", str(timeline_file)])
+    assert forwarded == [["--input-timeline", str(timeline_file)]]
+
+
+@pytest.mark.parametrize("flag", ["--work", "--w"])
+def test_worker_flag_abbreviations_are_rejected(monkeypatch, timeline_file, flag):
+    monkeypatch.setattr(worker, "run_in_worker", lambda argv: pytest.fail("abbreviation enabled worker mode"))
+    with pytest.raises(SystemExit):
+        main.main([flag, "--input-timeline", str(timeline_file)])
+
+
+def test_handle_request_does_not_forward_again(monkeypatch, tmp_path, timeline_file):
+    monkeypatch.setattr(worker, "run_in_worker", lambda argv: pytest.fail("worker forwarded to itself"))
+    response = worker.handle_request(
+        ["--worker", "--input-timeline", str(timeline_file), "--timeline-json", "out.json"], str(tmp_path))
+    assert response["code"] == 0
+    assert json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))[0]["t"] == 1.0
+
+
+def test_handle_request_round_trip(tmp_path, timeline_file):
+    response = worker.handle_request(
+        ["--input-timeline", timeline_file.name, "--timeline-json", "out.json"], str(tmp_path))
+    assert response == {"code": 0, "output": "Timeline written to out.json\n"}
+    assert os.getcwd() != str(tmp_path)
+
+
+def test_handle_request_reports_usage_errors(tmp_path):
+    response = worker.handle_request([], str(tmp_path))
+    assert response["code"] == 2
+    assert "--video or --input-timeline" in response["output"]
+
+
+def test_handle_request_uses_caller_env(monkeypatch, tmp_path, timeline_file):
+    seen = {}
+    monkeypatch.setenv("OPENAI_API_KEY", "worker-key")
+    monkeypatch.setenv("AWS_PROFILE", "worker-profile")
+    monkeypatch.setattr(main, "run", lambda args, parser: seen.update(
+        key=os.getenv("OPENAI_API_KEY"), profile=os.getenv("AWS_PROFILE"), path=os.getenv("PATH")))
+    worker.handle_request(["--input-timeline", str(timeline_file)], str(tmp_path),
+                          {"OPENAI_API_KEY": "caller-key", "PATH": "/caller/bin"})
+    # Only credential variables are taken from the caller, and the worker's come back afterwards
+    assert seen["key"] == "caller-key" and seen["profile"] is None and seen["path"] != "/caller/bin"
+    assert os.getenv("OPENAI_API_KEY") == "worker-key" and os.getenv("AWS_PROFILE") == "worker-profile"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_authkey_file_is_private(tmp_path):
+    path = str(tmp_path / "keys" / "worker-8765.key")
+    worker.write_authkey(b"old", path)
+    os.chmod(path, 0o644)
+    worker.write_authkey(b"new", path)
+    assert worker.read_authkey(path) == b"new"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_no_keyfile_means_no_worker(monkeypatch, tmp_path):
+    monkeypatch.setenv("VIDEO_COMMENTATOR_WORKER_KEYDIR", str(tmp_path))
+    assert worker.run_in_worker(["--help"]) is None
+
+
+def test_silent_listener_falls_back_in_process(monkeypatch, tmp_path):
+    # Something that accepts connections but never speaks the worker protocol
+    monkeypatch.setenv("VIDEO_COMMENTATOR_WORKER_KEYDIR", str(tmp_path))
+    monkeypatch.setattr(worker, "HANDSHAKE_TIMEOUT", 0.2)
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        address = server.getsockname()
+        worker.write_authkey(b"k" * 32, worker.keyfile_path(address[1]))
+        assert worker.run_in_worker(["--help"], address) is None
+
+
+def test_worker_dying_mid_run_is_reported(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("VIDEO_COMMENTATOR_WORKER_KEYDIR", str(tmp_path))
+    key = b"k" * 32
+    with Listener(("127.0.0.1", 0), authkey=key) as listener:
+        address = listener.address
+        worker.write_authkey(key, worker.keyfile_path(address[1]))
+
+        def accept_and_hang_up():
+            conn = listener.accept()
+            conn.recv()
+            conn.close()
+
+        thread = threading.Thread(target=accept_and_hang_up, daemon=True)
+        thread.start()
+        assert worker.run_in_worker(["--help"], address) == 1
+        thread.join(timeout=5)
+    assert "Lost connection to the worker" in capsys.readouterr().out
+
+
+def test_openai_client_follows_caller_base_url(monkeypatch, tmp_path, timeline_file):
+    class FakeOpenAI:
+        def __init__(self, api_key=None, base_url=None, organization=None, project=None):
+            self.api_key, self.base_url, self.project = api_key, base_url, project
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+    clients._openai_client.cache_clear()
+    monkeypatch.setenv("OPENAI_API_KEY", "shared-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", "https://worker-proxy")
+    seen = []
+    monkeypatch.setattr(main, "run", lambda args, parser: seen.append(clients.openai_client()))
+    argv = ["--input-timeline", str(timeline_file)]
+    worker.handle_request(argv, str(tmp_path), {"OPENAI_API_KEY": "shared-key", "OPENAI_BASE_URL": "https://a-proxy"})
+    worker.handle_request(argv, str(tmp_path), {"OPENAI_API_KEY": "shared-key", "OPENAI_BASE_URL": "https://b-proxy"})
+    clients._openai_client.cache_clear()
+    assert [c.base_url for c in seen] == ["https://a-proxy", "https://b-proxy"]
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_worker(port):
+    thread = threading.Thread(target=worker.serve, args=(("127.0.0.1", port),), daemon=True)
+    thread.start()
+    for _ in range(100):
+        key = worker.read_authkey(worker.keyfile_path(port))
+        if key:
+            return thread, key
+        threading.Event().wait(0.05)
+    pytest.fail("worker did not start")
+
+
+def test_serve_survives_bad_requests(monkeypatch, tmp_path, timeline_file):
+    monkeypatch.setenv("VIDEO_COMMENTATOR_WORKER_KEYDIR", str(tmp_path))
+    monkeypatch.setattr(worker, "warm_up", lambda: None)
+    address = ("127.0.0.1", _free_port())
+    thread, key = _start_worker(address[1])
+
+    def send(request):
+        with Client(address, authkey=key) as conn:
+            conn.send(request)
+            return conn.recv()
+
+    assert send({"cwd": str(tmp_path)})["code"] == 2
+    assert send(["not", "a", "dict"])["code"] == 2
+    with Client(address, authkey=key) as conn:
+        # Caller hangs up before the response is sent
+        conn.send({"argv": ["--input-timeline", str(timeline_file)], "cwd": str(tmp_path)})
+    assert worker.run_in_worker(["--input-timeline", str(timeline_file), "--timeline-json",
+                                 str(tmp_path / "out.json")], address) == 0
+    assert send({"stop": True})["output"] == "Worker stopped.\n"
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert worker.read_authkey(worker.keyfile_path(address[1])) is None
+
+
+def test_workers_on_different_ports_keep_their_own_keys(monkeypatch, tmp_path, timeline_file):
+    monkeypatch.setenv("VIDEO_COMMENTATOR_WORKER_KEYDIR", str(tmp_path))
+    monkeypatch.setattr(worker, "warm_up", lambda: None)
+    first, second = ("127.0.0.1", _free_port()), ("127.0.0.1", _free_port())
+    first_thread, _ = _start_worker(first[1])
+    second_thread, _ = _start_worker(second[1])
+    argv = ["--input-timeline", str(timeline_file), "--timeline-json", str(tmp_path / "out.json")]
+    assert worker.run_in_worker(argv, first) == 0
+    assert worker._send({"stop": True}, second)["code"] == 0
+    second_thread.join(timeout=5)
+    # Stopping the second worker leaves the first one usable
+    assert worker.run_in_worker(argv, first) == 0
+    worker._send({"stop": True}, first)
+    first_thread.join(timeout=5)
+
+
+def test_shutdown_keeps_key_file_taken_over_by_another_worker(monkeypatch, tmp_path):
+    monkeypatch.setenv("VIDEO_COMMENTATOR_WORKER_KEYDIR", str(tmp_path))
+    monkeypatch.setattr(worker, "warm_up", lambda: None)
+    address = ("127.0.0.1", _free_port())
+    thread, key = _start_worker(address[1])
+    keyfile = worker.keyfile_path(address[1])
+    with Client(address, authkey=key) as conn:
+        worker.write_authkey(b"other-worker", keyfile)
+        conn.send({"stop": True})
+        conn.recv()
+    thread.join(timeout=5)
+    assert worker.read_authkey(keyfile) == b"other-worker"